@@ -9,51 +9,46 @@ quirks:
   without pipelike stdin, calls git.py [--help] [--make-bin] SHFILE [SHWORD ...]
   with pipelike stdin, calls |grep.py SHFILE [SHWORD ...]
   test results found by calling with SHWORD but without a SHFILE of 'bin/g' don't much matter
+  the bin/g* Shell Scripts call g.sh, which starts no Python here when Stdin is a Terminal
 
 examples:
   g.py  # git.py
   echo |g.py  # grep.py
   g.py <requirements.txt  # grep.py
   g.py </dev/null  # git.py
+  g.py <&-  # git.py
   cat <(g.py)  # git.py
   cat <(g.py) |cat -  # git.py, no matter that Zsh infers </dev/null
 """
 
 import os
-import signal
 import stat
-import subprocess
 import sys
 
 #
 
 
-ifstat = os.fstat(sys.stdin.fileno())
-os_devnull_rdev = os.stat(os.devnull).st_rdev
-inull = stat.S_ISCHR(ifstat.st_mode) and (ifstat.st_rdev == os_devnull_rdev)
-ipipelike = (not sys.stdin.isatty()) and (not inull)  # lets 'cat <(g.py) |' work at Zsh
+os_devnull_stat = os.stat(os.devnull)
+try:
+    ifstat = os.fstat(0)  # not 'sys.stdin.fileno()', because 'sys.stdin' is None after '<&-'
+except OSError:
+    ifstat = os_devnull_stat  # takes a closed Stdin as if </dev/null
+
+ichr = stat.S_ISCHR(ifstat.st_mode)  # a Terminal or /dev/null, not a Pipe or File
+inull = ichr and (ifstat.st_rdev == os_devnull_stat.st_rdev)
+iisatty = ichr and (not inull) and os.isatty(0)  # skips the ioctl for Pipes and Files
+ipipelike = (not iisatty) and (not inull)  # lets 'cat <(g.py) |' work at Zsh
 
-shverb = "grep.py" if ipipelike else "git.py"
+shverb = ("git.py", "grep.py")[ipipelike]  # indexes by False = 0, True = 1
 argv0 = os.path.join(os.path.dirname(__file__), shverb)
 
 argv = list(sys.argv)
 argv[0] = argv0
 
 
-assert int(0x80 + signal.SIGINT) == 130
-pass_fds = tuple(int(_) for _ in os.listdir("/dev/fd"))
-try:
-    run = subprocess.run(argv, pass_fds=pass_fds)
-except KeyboardInterrupt:
-    if sys.platform == "darwin":
-        print(file=sys.stderr)  # after "^" and "C" printed without a "\r\n"
-    sys.exit(130)
-
-    # subprocess.run raises KeyboardInterrupt even when the called Python does catch & exit
-    # Linux Shells print a "\r\n" after Python exits after catching a KeyboardInterrupt
-
+os.execv(argv0, argv)  # replaces this Process, so no Parent left to catch ⌃C or relay Exit
 
-sys.exit(run.returncode)
+# exec keeps every Fd not marked Close-On-Exec, such as the /dev/fd/12 of Zsh '<(...)'
 
 
 # posted as:  https://github.com/pelavarre/pylitfun/blob/main/bin/g.py
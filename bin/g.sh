@@ -0,0 +1,9 @@
+#!/bin/sh
+# bin/g.sh = call the colocated git.py from a Terminal, else let g.py choose git.py or |grep.py
+# takes only '[ -t 0 ]' from POSIX Test, and leaves g.py to sort out </dev/null & a closed Stdin
+
+if [ -t 0 ]; then
+    exec "$(dirname "$0")/git.py" "$@"
+fi
+
+exec "$(dirname "$0")/g.py" "$@"
@@ -11,7 +11,11 @@ positional arguments:
 
 options:
   --help      show this help message and exit (-h is for Git, not for Git·Py)
-  --make-bin  rewrite bin/g* as Shell Scripts to call g.py to call git.py
+  --make-bin  rewrite bin/g* as Shell Scripts to call g.sh to call git.py
+
+quirks:
+  runs Git in place of Git·Py, so doesn't print '+ exit N' when that one plain call of Git fails
+  stays the Parent of Git for 'gcaa', to rescue the Commit Message, and for '... && ...' Lines
 
 examples:
   gg -w gg ggl
@@ -27,16 +31,15 @@ examples:
 # code reviewed by people and by Black, Flake8, Mypy-Strict, & Pylance-Standard
 
 
-import datetime as dt
-import difflib
+from __future__ import annotations  # backports new Datatype Syntaxes into old Pythons
+
 import os
-import pathlib
+import re
 import shlex
 import signal
 import subprocess
 import sys
-import textwrap
-import time
+import types
 import typing
 
 if not __debug__:
@@ -48,7 +51,7 @@ assert int(0x80 + signal.SIGINT) == 130
 
 # Configure
 
-ShlinePlusByShverb = {  # sorted by key
+ShlinePlusByShverb: typing.Mapping[str, str] = {  # sorted by key
     # 0
     "g": "git status --short [...]",
     "ga": "git add ...",
@@ -103,12 +106,56 @@ ShlinePlusByShverb = {  # sorted by key
 # often does say '--color-moved' with Hyphen-Minus, but never says '--color=moved' with Equals Sign
 
 
-_a_ = list(ShlinePlusByShverb.keys())
-_b_ = sorted(_a_)
-_diffs_ = list(difflib.unified_diff(a=_a_, b=_b_, fromfile="a", tofile="b", lineterm=""))
-if _diffs_:
-    print("\n".join(_diffs_), file=sys.stderr)
-assert not _diffs_, (_diffs_,)
+_keys_ = list(ShlinePlusByShverb.keys())
+if not all((a < b) for a, b in zip(_keys_, _keys_[1:])):  # one pass, no sort, no diff
+    import difflib  # imported late, only to say how the Keys fell out of order
+
+    _diffs_ = list(difflib.unified_diff(_keys_, sorted(_keys_), "a", "b", lineterm=""))
+    assert False, (_diffs_,)
+
+ShlinePlusByShverb = types.MappingProxyType(ShlinePlusByShverb)  # frozen, to keep its Keys sorted
+
+
+_args_by_shverb_: dict[str, str] = dict()  # classified once at Import, not at each call
+for _shverb_, _shline_plus_ in ShlinePlusByShverb.items():
+    if _shline_plus_.endswith(" [...]"):
+        _args_by_shverb_[_shverb_] = "[...]"  # accepts >= 0 Shell Args
+    elif _shline_plus_.endswith("..."):
+        _args_by_shverb_[_shverb_] = "..."  # requires >= 1 Shell Args
+    else:
+        _args_by_shverb_[_shverb_] = ""  # accepts no leading Positional Arg
+
+ArgsByShverb: typing.Mapping[str, str] = types.MappingProxyType(_args_by_shverb_)
+
+
+_shline_by_shverb_: dict[str, str] = dict()  # stripped once at Import, not at each call
+for _shverb_, _shline_plus_ in ShlinePlusByShverb.items():
+    _shline_by_shverb_[_shverb_] = _shline_plus_
+    for _suffix_ in (" [...]", " -ai -e ... -e ...", " -a -e ... -e ...", " --author=...", " ..."):
+        if _shline_plus_.endswith(_suffix_):
+            _shline_by_shverb_[_shverb_] = _shline_plus_.removesuffix(_suffix_)
+            break
+
+ShlineByShverb: typing.Mapping[str, str] = types.MappingProxyType(_shline_by_shverb_)
+
+
+DefaultShargByShverb: typing.Mapping[str, str] = types.MappingProxyType(
+    {  # the 1 Shell Arg to add when given no Shell Args
+        "gcaf": "HEAD",  # tilts into:  git commit --all --fixup HEAD
+        "gcf": "HEAD",  # tilts into:  git commit --fixup HEAD
+        "gf": "--quiet",  # tilts into:  gf --quiet
+        "gl": "-1",  # tilts into:  gl -1
+        "glq": "-9",  # tilts into:  glq -9
+        "glqn": "-9",
+        "glv": "-9",  # tilts into:  glv -9
+        "grl": "-9",
+    }
+)
+
+TtyDefaultShverbs = ("gl", "glq", "glqn", "glv")  # add their Default only when Stdout is a Tty
+
+assert all((_ in ShlinePlusByShverb) for _ in DefaultShargByShverb.keys())
+assert all((_ in DefaultShargByShverb) for _ in TtyDefaultShverbs)
 
 
 # Run from the Shell Command Line
@@ -126,9 +173,19 @@ class GitGopher:
 
     stdout_isatty: bool
 
+    gwho_run: subprocess.CompletedProcess[bytes] | None  # 'git config user.email', run once
+    gtop_run: subprocess.CompletedProcess[bytes] | None  # 'git rev-parse --show-toplevel', once
+    gtop_walked: str | None  # the Git Top found by walking up from the Pwd, walked once
+    gdno_run: subprocess.CompletedProcess[bytes] | None  # 'git diff --name-only', run once
+
     def __init__(self) -> None:
         self.stdout_isatty = sys.stdout.isatty()  # sampled once
 
+        self.gwho_run = None
+        self.gtop_run = None
+        self.gtop_walked = None
+        self.gdno_run = None
+
     def go_for_it(self) -> None:
 
         # Quit early for good reasons
@@ -143,27 +200,22 @@ class GitGopher:
 
         self.exit_if_dash_dash_make_bin()
 
-        # Take the Git Clone at the Pwd as more Args
-
-        gwho = self.find_git_who()
-        gtop = self.find_git_top(default=None)
-
         # Choose a Shell Verb and Shell Args to come after it
 
         shfile_shargv = sys.argv[1:]
 
-        shverb = os.path.basename(shfile_shargv[0])
+        shverb = shfile_shargv[0].rpartition("/")[-1]  # same as Posix basename, in C
         assert shverb, (shfile_shargv, shverb)
         sys_shargv = (shverb, *shfile_shargv[1:])
-        sys_shline = " ".join(shlex_quote_calmly(_) for _ in sys_shargv)
+        sys_shline = shlex_join_calmly(sys_shargv)
 
         chosen_shverb = self.form_shverb_for_shargv(sys_shargv)
         chosen_shargv = (chosen_shverb, *sys_shargv[1:])
 
         # Replace the Shell Verb with a Git Shell Line, and edit the Args
 
-        found_shline, given_shsuffix = self.form_shverb_shline(chosen_shargv, gwho=gwho)
-        tweaked_shargv = self.shargv_tweak_up(chosen_shverb, shargv=chosen_shargv, gwho=gwho)
+        found_shline, given_shsuffix = self.form_shverb_shline(chosen_shargv)
+        tweaked_shargv = self.shargv_tweak_up(chosen_shverb, shargv=chosen_shargv)
 
         # Choose to call Git through Shell or not
 
@@ -173,16 +225,21 @@ class GitGopher:
 
         # Take the Shell Pwd & Git Diff into account
 
-        relpath = os.path.relpath(gtop)
-        if gtop != os.getcwd():
-            if chosen_shverb in ("ga", "gcl", "glf"):
-                print(f"# {chosen_shverb!r} not at:  cd {relpath}/", file=sys.stderr)
+        stderr_lines: list[str] = list()  # written together, not one Print at a time
+
+        if chosen_shverb in ("ga", "gcl", "glf"):  # forks 'git rev-parse' only for these
+            gtop = self.find_git_top(default=None)
+            cwd = os.getcwd()  # called once, not again inside 'os.path.relpath'
+            if gtop != cwd:
+                relpath = os.path.relpath(gtop, start=cwd)
+                stderr_lines.append(f"# {chosen_shverb!r} not at:  cd {relpath}/")
 
         diff_shverb, diff_shline = self.shline_at_git_diff(
             chosen_shverb, shline=shell_shline, tweaked_shargv=tweaked_shargv
         )
 
         diff_shargv = (diff_shverb, *tweaked_shargv[1:])
+        diff_shargs_shline = shlex_join_calmly(diff_shargv[1:])  # joined once, spoken twice
 
         # Show what could happen again at another host or time, but do speak before Auth
 
@@ -191,18 +248,19 @@ class GitGopher:
             authable = diff_shline.removeprefix("... && ")
             taggable = "echo Press ⌃D && cat - >/dev/null && " + authable
 
-        taggable_shline = taggable + " " + " ".join(shlex_quote_calmly(_) for _ in diff_shargv[1:])
-        taggable_shline = taggable_shline.rstrip()
+        taggable_shline = f"{taggable} {diff_shargs_shline}".rstrip()
         taggable_shline = self.tagged_shline_to_brief(taggable_shline)
 
         tagged_shverb = "gg" if diff_shverb in ("gg/0", "gg/n") else diff_shverb
         tagged_shline = f": {tagged_shverb}{given_shsuffix} && {taggable_shline}"
 
+        glqn_awk_shline = """ |awk '{print "HEAD~"(NR-1), $0}'"""
         if tagged_shverb == "glqn":
             assert shell, (shell, tagged_shverb, tagged_shline)
-            tagged_shline += """ |awk '{print "HEAD~"(NR-1), $0}'"""
+            tagged_shline += glqn_awk_shline
 
-        print(tagged_shline, file=sys.stderr)  # prints its ":", not after a "+" or "|"
+        stderr_lines.append(tagged_shline)  # prints its ":", not after a "+" or "|"
+        sys.stderr.write("".join((_ + "\n") for _ in stderr_lines))
 
         # Explicitly auth the especially destructive ops
 
@@ -210,14 +268,24 @@ class GitGopher:
 
         # Shove back on Python ShLex Quote fussily quoting mentions of HEAD~... to no purpose
 
-        run_shline = authed + " " + " ".join(shlex_quote_calmly(_) for _ in diff_shargv[1:])
-        run_shline = run_shline.rstrip()
+        run_shline = f"{authed} {diff_shargs_shline}".rstrip()
 
         if tagged_shverb == "glqn":
             assert shell, (shell, tagged_shverb, run_shline)
-            run_shline += """ |awk '{print "HEAD~"(NR-1), $0}'"""
-
-        run_shargv = shlex.split(authed) + list(diff_shargv[1:])
+            run_shline += glqn_awk_shline
+
+        # Split the Pipe of Processes, but only at our own '|', never at a '|' among the Args
+
+        if " && " not in authed:
+            run_shargvs = self.shline_split_pipe(authed)
+        else:  # splits each Step here once, not again as each Step runs
+            run_shargvs = list()
+            for step_shline in authed.split(" && "):
+                (step_shargv,) = self.shline_split_pipe(step_shline)  # requires no '|' in a Step
+                run_shargvs.append(step_shargv)
+        run_shargvs[-1].extend(diff_shargv[1:])
+        if tagged_shverb == "glqn":
+            run_shargvs.extend(self.shline_split_pipe(glqn_awk_shline.removeprefix(" |")))
 
         # Do the chosen work
 
@@ -228,7 +296,7 @@ class GitGopher:
             diff_shverb=diff_shverb,
             diff_shargv=diff_shargv,
             run_shline=run_shline,
-            run_shargv=run_shargv,
+            run_shargvs=run_shargvs,
         )
 
         # Exit happy or sad, same as the Shell
@@ -255,7 +323,7 @@ class GitGopher:
             sys.exit(0)  # exits 0 after printing Help
 
     def exit_if_dash_dash_make_bin(self) -> None:
-        """Rewrite bin/g* as Shell Scripts to call g.py to call git.py"""
+        """Rewrite bin/g* as Shell Scripts to call g.sh to call git.py"""
 
         if sys.argv[1:] != ["--make-bin"]:
             return
@@ -264,6 +332,8 @@ class GitGopher:
 
         #
 
+        import pathlib  # imported late, because rarely called for
+
         removals = ["gcl", "grhu", "gsis"]
 
         alt_shline_plus_by_shverb = dict(shline_plus_by_shverb)
@@ -319,17 +389,7 @@ class GitGopher:
                 if shverb == "gg/n":
                     continue
 
-            framed_text = f"""
-
-                #!/bin/sh
-                # : {alt_shverb} && {shline_plus}
-                g.py "$0" "$@"
-
-            """
-
-            text = textwrap.dedent(framed_text).strip()
-
-            lines = text.splitlines()
+            lines = ["#!/bin/sh", f"# : {alt_shverb} && {shline_plus}", 'exec "$(dirname "$0")/g.sh" "$0" "$@"']
             if shverb in before_shline_by_shverb:
                 lines[1:1] = [before_shline_by_shverb[shverb]]
             if shverb in ends_shline_by_shverb:
@@ -337,14 +397,14 @@ class GitGopher:
             if shverb in after_shline_by_shverb:
                 lines[-1:-1] = [after_shline_by_shverb[shverb]]
 
-            write_text = "\n".join(lines) + "\n"
+            write_bytes = ("\n".join(lines) + "\n").encode()
 
             path = pathlib.Path(pathname)
-            read_text = path.read_text()  # requires readable
+            read_bytes = path.read_bytes()  # requires readable
 
-            if write_text != read_text:
+            if write_bytes != read_bytes:
                 print(f"{pathname}", file=sys.stderr)
-                path.write_text(write_text)
+                path.write_bytes(write_bytes)
 
             x_ok = os.access(pathname, mode=os.X_OK)
             assert x_ok, (pathname, x_ok)  # requires executable
@@ -360,22 +420,26 @@ class GitGopher:
 
         gwho_shline = "git config user.email"
 
-        gwho_run = subprocess.run(
-            shlex.split(gwho_shline),
-            stdin=subprocess.DEVNULL,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        gwho_run = self.gwho_run
+        if gwho_run is None:
+            gwho_run = subprocess.run(
+                gwho_shline.split(),  # no Quotes to parse
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            self.gwho_run = gwho_run
 
         # Exit nonzero and explain why, if need be
 
         if gwho_run.returncode:
 
-            print(f": gwho && {gwho_run}", file=sys.stderr)
-            sys.stderr.write(gwho_run.stdout.decode())  # written to Stderr, and commonly empty
-            sys.stderr.write(gwho_run.stderr.decode())
-
-            print(f"+ exit {gwho_run.returncode}", file=sys.stderr)
+            sys.stderr.write(  # written all at once
+                f": gwho && {gwho_shline}\n"
+                + gwho_run.stdout.decode()  # written to Stderr, and commonly empty
+                + gwho_run.stderr.decode()
+                + f"+ exit {gwho_run.returncode}\n"
+            )
 
             sys.exit(gwho_run.returncode)
 
@@ -387,19 +451,31 @@ class GitGopher:
         return gwho
 
         # todo: merge with nearly identical .find_git_top
-        # todo: run .find_git_who at most once per Process
 
     def find_git_top(self, default: str | None) -> str:
         """Find RealPath of the enclosing Git Clone, else complain & exit nonzero"""
 
         gtop_shline = "git rev-parse --show-toplevel"
 
-        gtop_run = subprocess.run(
-            shlex.split(gtop_shline),
-            stdin=subprocess.DEVNULL,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,  # small 2 Lines here, vs like 129 Lines from "git diff"
-        )
+        gtop_walked = self.gtop_walked
+        if gtop_walked is not None:
+            return gtop_walked
+
+        if self.gtop_run is None:  # walks only once, because a failed Walk leads to a Run
+            gtop_walked = self.find_git_top_by_walk()
+            if gtop_walked is not None:
+                self.gtop_walked = gtop_walked
+                return gtop_walked  # forks no 'git rev-parse'
+
+        gtop_run = self.gtop_run
+        if gtop_run is None:
+            gtop_run = subprocess.run(
+                gtop_shline.split(),  # no Quotes to parse
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,  # small 2 Lines here, vs like 129 Lines from "git diff"
+            )
+            self.gtop_run = gtop_run
 
         # Exit nonzero and explain why, if Pwd not inside a Git Clone
 
@@ -407,11 +483,12 @@ class GitGopher:
             if default is not None:
                 return default
 
-            print(f": gtop && {gtop_shline}", file=sys.stderr)
-            sys.stderr.write(gtop_run.stdout.decode())  # written to Stderr, and commonly empty
-            sys.stderr.write(gtop_run.stderr.decode())
-
-            print(f"+ exit {gtop_run.returncode}", file=sys.stderr)
+            sys.stderr.write(  # written all at once
+                f": gtop && {gtop_shline}\n"
+                + gtop_run.stdout.decode()  # written to Stderr, and commonly empty
+                + gtop_run.stderr.decode()
+                + f"+ exit {gtop_run.returncode}\n"
+            )
 
             sys.exit(gtop_run.returncode)
 
@@ -423,7 +500,70 @@ class GitGopher:
         return gtop
 
         # todo: merge with nearly identical .find_git_who
-        # todo: run .find_git_top at most once per Process
+
+    def find_git_top_by_walk(self) -> str | None:
+        """Find the nearest Dir holding a '.git' Dir or File, else None when Git might disagree"""
+
+        env = os.environ
+        names = "GIT_DIR GIT_WORK_TREE GIT_CEILING_DIRECTORIES GIT_DISCOVERY_ACROSS_FILESYSTEM"
+        if any((_ in env) for _ in names.split()):
+            return None  # leaves these to 'git rev-parse'
+
+        try:
+            walk = os.getcwd()  # a RealPath, same as 'git rev-parse --show-toplevel' gives
+            walk_st_dev = os.stat(walk).st_dev
+        except OSError:
+            return None  # leaves a deleted Pwd and such to 'git rev-parse'
+
+        if "/.git/" in (walk + "/"):
+            return None  # leaves inside '.git/' to 'git rev-parse'
+
+        while True:
+            found = self._find_plain_dotgit_(walk)
+            if found is not None:
+                return walk if found else None  # leaves a stray or broken '.git' to Git
+
+            if os.path.exists(os.path.join(walk, "HEAD")):
+                return None  # leaves a maybe Bare Repo to 'git rev-parse'
+
+            parent = os.path.dirname(walk)
+            if parent == walk:
+                return None  # leaves no Repo at all to 'git rev-parse'
+
+            try:
+                parent_st_dev = os.stat(parent).st_dev
+            except OSError:
+                return None
+
+            if parent_st_dev != walk_st_dev:
+                return None  # leaves the Mount Point to 'git rev-parse', where Git stops
+
+            walk = parent
+
+    def _find_plain_dotgit_(self, walk: str) -> bool | None:
+        """Say None if no '.git' here, True if a Dir with HEAD or a 'gitdir:' File, else False"""
+
+        dotgit = os.path.join(walk, ".git")
+        try:
+            dotgit_stat = os.stat(dotgit)
+        except FileNotFoundError:
+            return None
+        except OSError:
+            return False  # leaves an unreadable '.git' to 'git rev-parse'
+
+        if dotgit_stat.st_uid != os.geteuid():
+            return False  # leaves 'git config safe.directory' to 'git rev-parse'
+
+        if os.path.isdir(dotgit):
+            return os.path.isfile(os.path.join(dotgit, "HEAD"))
+
+        try:
+            with open(dotgit, "rb") as reader:
+                head = reader.read(len(b"gitdir:"))
+        except OSError:
+            return False
+
+        return head == b"gitdir:"  # such as the '.git' File of a Worktree or Submodule
 
     #
     # Choose the ShVerb
@@ -435,7 +575,6 @@ class GitGopher:
         shverb = shargv[0]
 
         shline_plus_by_shverb = ShlinePlusByShverb
-        git_shverbs = tuple(shline_plus_by_shverb.keys())
 
         # Take 'gg' as 'gg/n', except as 'gg/0' when no obvious Positional Arguments
 
@@ -450,10 +589,9 @@ class GitGopher:
 
         # Reject the Shell Verb if it has no Git Alias Expansion here
 
-        if alt_shverb not in git_shverbs:
-            print(
-                f"don't choose {alt_shverb!r}, do choose from {list(git_shverbs)}", file=sys.stderr
-            )
+        if alt_shverb not in shline_plus_by_shverb:  # hashes, no Tuple of Keys to scan
+            git_shverbs = list(shline_plus_by_shverb.keys())
+            print(f"don't choose {alt_shverb!r}, do choose from {git_shverbs}", file=sys.stderr)
             sys.exit(2)  # exits 2 for bad args
 
         # Succeed
@@ -483,41 +621,42 @@ class GitGopher:
     # Form the ShLine
     #
 
-    def form_shverb_shline(self, shargv: tuple[str, ...], gwho: str) -> tuple[str, str]:
+    def form_shverb_shline(self, shargv: tuple[str, ...]) -> tuple[str, str]:
         """Expand the Shell Verb as a Git Alias, with or without Args"""
 
         shverb = shargv[0]
 
         shline_plus_by_shverb = ShlinePlusByShverb
         shverb_shline_plus = shline_plus_by_shverb[shverb]
+        shverb_args = ArgsByShverb[shverb]
 
         # Require >= 1 Shell Args
         # or else:  Accept >= 0 Shell Args, and sometimes add 1 Shell Arg
         # or else:  Accept no Shell Args, else require first Shell Arg not obviously a Positional Arg
 
-        if shverb_shline_plus.endswith("..."):
+        if shverb_args == "...":
 
             shline, shsuffix = self._form_shline_required_args_(
-                shverb, shverb_shline_plus=shverb_shline_plus, shargv=shargv, gwho=gwho
+                shverb, shverb_shline_plus=shverb_shline_plus, shargv=shargv
             )
 
-        elif shverb_shline_plus.endswith(" [...]"):
+        elif shverb_args == "[...]":
 
             shline, shsuffix = self._form_shline_optional_args_(
-                shverb, shverb_shline_plus=shverb_shline_plus, shargv=shargv, gwho=gwho
+                shverb, shverb_shline_plus=shverb_shline_plus, shargv=shargv
             )
 
         else:
 
             shline, shsuffix = self._form_shline_no_leading_pos_arg_(
-                shverb, shverb_shline_plus=shverb_shline_plus, shargv=shargv, gwho=gwho
+                shverb, shverb_shline_plus=shverb_shline_plus, shargv=shargv
             )
 
-        assert shsuffix in ("", " ..."), (shsuffix, shline, shverb, shargv, gwho)
+        assert shsuffix in ("", " ..."), (shsuffix, shline, shverb, shargv)
         return (shline, shsuffix)
 
     def _form_shline_required_args_(
-        self, shverb: str, shverb_shline_plus: str, shargv: tuple[str, ...], gwho: str
+        self, shverb: str, shverb_shline_plus: str, shargv: tuple[str, ...]
     ) -> tuple[str, str]:
         """Handle case where >= 1 Shell Args are required"""
 
@@ -530,7 +669,7 @@ class GitGopher:
 
         if shverb_shline_plus == "git checkout ...":
             assert shverb == "gco", (shverb, shverb_shline_plus)
-            shline = shverb_shline_plus.removesuffix(" ...")
+            shline = ShlineByShverb[shverb]
 
             shsuffix = " ..."  # shouts out Args
             if not posargv:
@@ -545,10 +684,11 @@ class GitGopher:
 
         if shverb_shline_plus.endswith(" --author=..."):
             assert shverb == "gla", (shverb, shverb_shline_plus)
-            shline = shverb_shline_plus.removesuffix(" --author=...")
+            shline = ShlineByShverb[shverb]
 
             shsuffix = " ..."  # shouts out Args
             if not posargv:
+                gwho = self.find_git_who()
                 print(f"+ git config user.email ==> {gwho!r}", file=sys.stderr)
                 shline += " " + shlex.quote(f"--author={gwho}")
                 if not shargv[1:]:
@@ -579,11 +719,7 @@ class GitGopher:
 
         # Tweak away from Doc while heavily editing required Args
 
-        shline = shverb_shline_plus.removesuffix(" ...")
-        if shverb_shline_plus.endswith(" -ai -e ... -e ..."):
-            shline = shverb_shline_plus.removesuffix(" -ai -e ... -e ...")
-        elif shverb_shline_plus.endswith(" -a -e ... -e ..."):
-            shline = shverb_shline_plus.removesuffix(" -a -e ... -e ...")
+        shline = ShlineByShverb[shverb]  # without ' ...', ' -ai -e ... -e ...', etc
 
         shsuffix = " ..."  # shouts out Args
 
@@ -608,14 +744,14 @@ class GitGopher:
         # ga, gc, gco, gcp, gg/n, ggl, glf, grh
 
     def _form_shline_optional_args_(
-        self, shverb: str, shverb_shline_plus: str, shargv: tuple[str, ...], gwho: str
+        self, shverb: str, shverb_shline_plus: str, shargv: tuple[str, ...]
     ) -> tuple[str, str]:
         """Handle case where >= 0 Shell Args are accepted, and sometimes add 1 Shell Arg"""
 
         stdout_isatty = self.stdout_isatty
 
         assert shverb_shline_plus.endswith(" [...]"), (shverb_shline_plus,)
-        shline = shverb_shline_plus.removesuffix(" [...]")
+        shline = ShlineByShverb[shverb]
 
         shsuffix = " ..."  # shouts out Args
         posargs = tuple(
@@ -636,26 +772,9 @@ class GitGopher:
                 assert shverb in ("gl", "glq", "glqn", "gls", "glv"), (shverb, shline)
                 shline = shline.replace(" --color-moved", "")
 
-            #
-
-            if shverb_shline_plus == "git commit --all --fixup [...]":
-                assert shverb in ("gcaf",), (shverb, shline)
-                shline += " HEAD"  # tilts into:  git commit --all --fixup HEAD
-
-            elif shverb_shline_plus == "git commit --fixup [...]":
-                assert shverb in ("gcf",), (shverb, shline)
-                shline += " HEAD"  # tilts into:  git commit --fixup HEAD
-
-            elif shverb_shline_plus == "git log --pretty=fuller --no-decorate --color-moved [...]":
-                assert shverb == "gl", (shverb, shline)
-                if stdout_isatty:
-                    shline += " -1"  # tilts into:  gl -1
-
-            elif shverb_shline_plus.startswith("git log "):
-                assert shverb in ("glq", "glqn", "gls", "glv"), (shverb, shline)
-                if shverb not in ("gls",):  # tilts into:  gls --
-                    if stdout_isatty:
-                        shline += " -9"  # tilts into:  glq -9, glv -9
+            if shverb in DefaultShargByShverb:  # looks up, no matching of ShLines
+                if stdout_isatty or (shverb not in TtyDefaultShverbs):
+                    shline += " " + DefaultShargByShverb[shverb]  # but 'gls' tilts into:  gls --
 
         assert shsuffix in ("", " ..."), (shsuffix, shline, shverb, shargv)
         return (shline, shsuffix)
@@ -663,7 +782,7 @@ class GitGopher:
         # g, gcaf, gcf, gd, gdno, gg/0, gl, glf, glq, gls, glv, gno, gri, grias, gs, gspno
 
     def _form_shline_no_leading_pos_arg_(
-        self, shverb: str, shverb_shline_plus: str, shargv: tuple[str, ...], gwho: str
+        self, shverb: str, shverb_shline_plus: str, shargv: tuple[str, ...]
     ) -> tuple[str, str]:
         """Handle case where no Shell Args are accepted, or first Shell Arg must not be a Positional Arg"""
 
@@ -671,28 +790,15 @@ class GitGopher:
         assert not shverb_shline_plus.endswith("..."), (shverb_shline_plus,)
         assert not shverb_shline_plus.endswith(" [...]"), (shverb_shline_plus,)
 
-        stdout_isatty = self.stdout_isatty
-
         # Fill out some default Options, when given no Shell Args
 
         shline = shverb_shline_plus
         shsuffix = ""  # shouts out No Pos Args
 
         if not shargv[1:]:
-            o = (shverb, shline)
-            if shverb == "gf":
-                assert shverb_shline_plus.endswith("git fetch --prune --prune-tags --force"), o
-                shline += " --quiet"  # tilts into:  gf --quiet
-
-            elif shverb == "glqn":
-                assert shverb_shline_plus.startswith("git log --oneline --no-decorate |")
-                if stdout_isatty:
-                    count_eq_1 = 1
-                    shline = shverb_shline_plus.replace(" |", " -9 |", count_eq_1)
-
-            elif shverb == "grl":
-                assert shverb_shline_plus == "git reflog --date=relative --numstat", o
-                shline += " -9"
+            if shverb in DefaultShargByShverb:  # 'gf' and 'grl'
+                assert shverb not in TtyDefaultShverbs, (shverb,)
+                shline += " " + DefaultShargByShverb[shverb]
 
         # Accept no Shell Args
         # But if Shell Args, then require the first to be Not obviously Positional
@@ -721,7 +827,7 @@ class GitGopher:
     # Choose ShArgV
     #
 
-    def shargv_tweak_up(self, shverb: str, shargv: tuple[str, ...], gwho: str) -> tuple[str, ...]:
+    def shargv_tweak_up(self, shverb: str, shargv: tuple[str, ...]) -> tuple[str, ...]:
         """Tune Greps to presume text, ignore case, and match >= 1 patterns"""
 
         posargv = self._maybe_posargv_from_shargv_(shargv)
@@ -759,6 +865,7 @@ class GitGopher:
 
                 for i, sharg in enumerate(shargv[1:]):
                     if sharg == "--author":
+                        gwho = self.find_git_who()
                         print(f"+ git config user.email ==> {gwho!r}", file=sys.stderr)
 
                         words = list()
@@ -815,21 +922,18 @@ class GitGopher:
             assert shverb in ("gg/n", "ggl", "glf"), (shverb,)
             strs.append("-ai")  # -a = --text  # -i = --ignore-case
 
-        patterns: list[str] = list()
-        pathnames: list[str] = list()
+        head: tuple[str, ...] = shargs
+        tail: tuple[str, ...] = ()  # copies no Slices, when no '--'
+        if "--" in shargs:
+            cut = shargs.index("--")
+            head = shargs[:cut]
+            tail = shargs[cut:]
 
-        for i, arg in enumerate(shargs):
-            iplus = i + 1
-            if arg == "--":
-                strs.extend(shargs[i:])
-                pathnames.extend(shargs[iplus:])
-                break
-            elif arg.startswith("-"):
-                strs.append(arg)
-            else:
-                strs.append("-e")
-                strs.append(arg)
-                patterns.append(arg)
+        strs.extend(x for a in head for x in ((a,) if a.startswith("-") else ("-e", a)))
+        strs.extend(tail)
+
+        patterns: list[str] = list(_ for _ in head if not _.startswith("-"))
+        pathnames: list[str] = list(tail[1:])
 
         #
 
@@ -857,7 +961,7 @@ class GitGopher:
     def git_ls_files(self) -> list[str]:
         """List the Tracked Files by Pathname"""
 
-        argv = shlex.split("git ls-files")
+        argv = ["git", "ls-files"]
         run = subprocess.run(
             argv, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE
         )
@@ -875,7 +979,7 @@ class GitGopher:
     #
 
     def form_shell_shline(self, shverb: str, shline: str, given_shsuffix: str) -> tuple[bool, str]:
-        """Choose to call Git by way of .shell=False or .shell=True"""
+        """Choose to call Git as one Process, or else as a Pipe of Processes joined by '|'"""
 
         if shverb == "glf":
             if not given_shsuffix:
@@ -907,19 +1011,19 @@ class GitGopher:
         shell = False
         return (shell, shline)
 
-        # todo: operate 'glf ...' and 'glqn' and 'grv' without 'shell=True'
+        # operates 'glf ...' and 'glqn' and 'grv' without 'shell=True', via .subprocess_run_pipe
 
     def shline_at_git_diff(
         self, shverb: str, shline: str, tweaked_shargv: tuple[str, ...]
     ) -> tuple[str, str]:
         """Change up 'gcam' and 'gno' when truthy 'git diff --name-only'"""
 
-        shline_plus_by_shverb = ShlinePlusByShverb
+        shline_by_shverb = ShlineByShverb
 
         # Require 'gno' to expand to precisely accurate copies of 'gdno' and 'gspno'
 
-        gdno_shline = shline_plus_by_shverb["gdno"].removesuffix(" [...]")
-        gspno_shline = shline_plus_by_shverb["gspno"].removesuffix(" [...]")
+        gdno_shline = shline_by_shverb["gdno"]
+        gspno_shline = shline_by_shverb["gspno"]
 
         assert gdno_shline == "git diff --name-only"
         assert gspno_shline == "git show --pretty= --name-only"
@@ -939,18 +1043,23 @@ class GitGopher:
 
         # Try Git Diff once, and complain & exit nonzero if it fails
 
-        gdno_run = subprocess.run(
-            shlex.split(gdno_shline),
-            stdin=subprocess.DEVNULL,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        gdno_run = self.gdno_run
+        if gdno_run is None:
+            gdno_run = subprocess.run(
+                gdno_shline.split(),  # no Quotes to parse
+                stdin=subprocess.DEVNULL,
+                stdout=subprocess.PIPE,
+                stderr=subprocess.PIPE,
+            )
+            self.gdno_run = gdno_run
 
         if gdno_run.returncode or gdno_run.stderr:
-            print(f": gdno && {gdno_shline} && : ...", file=sys.stderr)
-            sys.stderr.write(gdno_run.stdout.decode())  # written to Stderr, and commonly empty
-            sys.stderr.write(gdno_run.stderr.decode())
-            print(f"+ exit {gdno_run.returncode}", file=sys.stderr)
+            sys.stderr.write(  # written all at once
+                f": gdno && {gdno_shline} && : ...\n"
+                + gdno_run.stdout.decode()  # written to Stderr, and commonly empty
+                + gdno_run.stderr.decode()
+                + f"+ exit {gdno_run.returncode}\n"
+            )
 
             sys.exit(gdno_run.returncode)
 
@@ -974,15 +1083,13 @@ class GitGopher:
         if not gdno_run_stdout:
             return (shverb, shline)  # this 'gcam' learned nothing from 'gdno'
 
-        pathnames = gdno_run_stdout.decode().splitlines()
-        message = "wip - " + " ".join(pathnames)
+        joined_pathnames = gdno_run_stdout.rstrip(b"\n").replace(b"\n", b" ")  # no List of Lines
+        message = "wip - " + joined_pathnames.decode()
 
-        gcam_shline_plus = "git commit --all -m " + repr(message)
+        gcam_shline_plus = "git commit --all -m " + shlex.quote(message)  # once, not per Pathname
 
         return ("gcam", gcam_shline_plus)  # this 'gcam' knows its 'gdno'
 
-        # todo: run .gdno_shline at most once per Process
-
     #
     # Trace & auth some Git work
     #
@@ -997,24 +1104,25 @@ class GitGopher:
             "git ls-files |grep -ai -e ",
         ]
 
-        argv = shlex.split(shline)
+        if len(shline) < 101:
+            return shline  # skips the ShLex Split, when short
+        if not shline.startswith(tuple(pathwalkers)):
+            return shline  # skips the ShLex Split, when not walking Paths
 
-        for pw in pathwalkers:
+        argv = shlex.split(shline)
 
-            if shline.startswith(pw):
-                if "--" in argv:
-                    i = argv.index("--")
-                    if i:
-                        head = argv[:i]
-                        tail = argv[i + 1 :]
+        if "--" in argv:
+            i = argv.index("--")
+            if i:
+                head = argv[:i]
+                tail = argv[i + 1 :]
 
-                        tn = os.path.split(tail[-1])[-1]
-                        t = str(len(tail)) + " [" + repr(tail[0]) + ", ..., '.../" + tn + "']"
+                if tail[2:]:
+                    tn = os.path.split(tail[-1])[-1]
+                    t = str(len(tail)) + " [" + repr(tail[0]) + ", ..., '.../" + tn + "']"
 
-                        if len(shline) >= 101:
-                            if tail[2:]:
-                                quotable = shlex.join(head) + " -- " + t
-                                return quotable
+                    quotable = shlex.join(head) + " -- " + t
+                    return quotable
 
         return shline
 
@@ -1031,11 +1139,11 @@ class GitGopher:
         authable = shline.removeprefix("... && ")
 
         print(f"Press ⌃D to auth:  {authable}", file=sys.stderr)
-        assert int(0x80 + signal.SIGINT) == 130
         try:
-            sys.stdin.read()
+            while os.read(0, 0x10000):  # discards Bytes till EOF, with no Text decode
+                pass
         except KeyboardInterrupt:
-            sys.exit(130)
+            sys.exit(130)  # 0x80 + signal.SIGINT, as checked at Import
 
         authed = authable
         return authed
@@ -1052,7 +1160,7 @@ class GitGopher:
         diff_shverb: str,
         diff_shargv: tuple[str, ...],
         run_shline: str,
-        run_shargv: list[str],
+        run_shargvs: list[list[str]],
     ) -> subprocess.CompletedProcess[bytes]:
         """Do the work"""
 
@@ -1068,11 +1176,19 @@ class GitGopher:
         # Call out to Shell, or call Git multiple times, or call Git once
 
         if shell:
-            git_run = subprocess.run(run_shline, shell=True)
+            git_run = self.subprocess_run_pipe(run_shargvs)
         elif " && " in run_shline:
             assert diff_shverb in ("gf", "gsis"), (diff_shverb, run_shline)
-            git_run = self.subprocess_run_shlines_till_exit_nonzero(run_shline.split(" && "))
+            git_run = self.subprocess_run_shargvs_till_exit_nonzero(run_shargvs)
         else:
+            assert len(run_shargvs) == 1, (run_shargvs,)
+            run_shargv = run_shargvs[-1]
+
+            if diff_shverb != "gcaa":  # 'gcaa' stays the Parent, to rescue the Commit Message
+                sys.stdout.flush()
+                sys.stderr.flush()
+                os.execvp(run_shargv[0], run_shargv)  # replaces this Process, no fork, no wait
+
             git_run = subprocess.run(run_shargv)
 
         if git_run.returncode:
@@ -1103,6 +1219,8 @@ class GitGopher:
     def rescue_git_commit_message(self, returncode: int) -> None:
         """Help recover when 'git commit' loses its input file"""
 
+        import pathlib  # imported late, because rarely called for
+
         print("+ cat .git/COMMIT_EDITMSG", file=sys.stderr)
 
         path = pathlib.Path(".git/COMMIT_EDITMSG")
@@ -1111,51 +1229,110 @@ class GitGopher:
         sys.stderr.flush()
         print(text)
         sys.stdout.flush()
-        print("+", file=sys.stderr)
-
-        print("Press ⌃D", file=sys.stderr)
-        assert int(0x80 + signal.SIGINT) == 130
+        sys.stderr.write("+\nPress ⌃D\n")  # written all at once
         try:
-            sys.stdin.read()
+            while os.read(0, 0x10000):  # discards Bytes till EOF, with no Text decode
+                pass
         except KeyboardInterrupt:
-            sys.exit(130)
+            sys.exit(130)  # 0x80 + signal.SIGINT, as checked at Import
 
         print("+ exit", returncode, file=sys.stderr)  # repeat after caller
 
         sys.exit(returncode)
 
+    #
+    # Run a Pipe of Processes, without forking a Shell to parse it
+    #
+
+    def shline_split_pipe(self, shline: str) -> list[list[str]]:
+        """Split a Shell Line into the ShArgV of each Process joined by '|'"""
+
+        if not any((_ in shline) for _ in "\"'\\|"):
+            return [shline.split()]  # skips the ShLex Lexer, when no Quotes, Escapes, or Pipes
+
+        lexer = shlex.shlex(shline, posix=True, punctuation_chars="|")
+        lexer.whitespace_split = True
+        lexer.commenters = ""  # takes '#' as a plain Char, same as 'shlex.split(comments=False)'
+
+        shargvs: list[list[str]] = [[]]
+        for token in lexer:
+            if token == "|":
+                shargvs.append(list())
+            else:
+                shargvs[-1].append(token)
+
+        return shargvs
+
+        # given only our own Shell Lines, because a quoted '|' among the Args would split here too
+
+    def subprocess_run_pipe(self, shargvs: list[list[str]]) -> subprocess.CompletedProcess[bytes]:
+        """Call each Process with its Stdin from the Stdout of the last, and return the last"""
+
+        procs: list[subprocess.Popen[bytes]] = list()
+
+        stdin: typing.IO[bytes] | None = None
+        try:
+            for index, shargv in enumerate(shargvs):
+                stdout = subprocess.PIPE if shargvs[(index + 1) :] else None
+                proc = subprocess.Popen(shargv, stdin=stdin, stdout=stdout)
+                if stdin is not None:
+                    stdin.close()  # lets the earlier Process see SigPipe when the later quits
+
+                stdin = proc.stdout
+                procs.append(proc)
+
+            returncodes = list(_.wait() for _ in procs)
+
+        finally:  # cleans up after a failed Popen, or a ⌃C while waiting
+
+            if stdin is not None:
+                stdin.close()
+
+            for proc in procs:
+                if proc.returncode is None:
+                    proc.kill()  # same as 'subprocess.run' does, when interrupted
+                    proc.wait()
+
+        run: subprocess.CompletedProcess[bytes]
+        run = subprocess.CompletedProcess(args=shargvs[-1], returncode=returncodes[-1])
+
+        return run  # exits like the Shell does without 'set -o pipefail'
+
     #
     # Run through each Step till first Fault
     #
 
-    def subprocess_run_shlines_till_exit_nonzero(
-        self, shlines: typing.Iterable[str]
+    def subprocess_run_shargvs_till_exit_nonzero(
+        self, shargvs: typing.Iterable[list[str]]
     ) -> subprocess.CompletedProcess[bytes]:
-        """Call the Shell for each Line and return the last, but quit early at exit nonzero, if any"""
+        """Call each ShArgV and return the last, but quit early at exit nonzero, if any"""
+
+        import time  # imported late, because rarely called for
 
-        shlines_list = list(shlines)
+        shargvs_list = list(shargvs)
 
-        run = subprocess.run(["true"], stdin=subprocess.DEVNULL)
-        assert run.returncode == 0, (run.returncode,)
+        run: subprocess.CompletedProcess[bytes]
+        run = subprocess.CompletedProcess(args=[], returncode=0)  # forks no 'true' to init
 
-        for shline in shlines_list:
+        for shargv in shargvs_list:
+            shline = shlex_join_calmly(shargv)
             print(f"+ {shline}", file=sys.stderr)
 
-            if shline.startswith(": "):
+            if shargv[:1] == [":"]:
                 assert "<" not in shline, (shline,)  # works towards interpreting ": ..." correctly
                 assert ">" not in shline, (shline,)
                 continue
 
-            removeprefix = shline.removeprefix("time ")
-            shargv = shlex.split(removeprefix)
+            timed = shargv[:1] == ["time"]
+            run_shargv = shargv[1:] if timed else shargv  # split once by the Caller, not here
 
             t0 = time.time()
-            run = subprocess.run(shargv)
+            run = subprocess.run(run_shargv)
             t1 = time.time()
 
             t1t0 = t1 - t0
-            strftime = dt_timedelta_strftime(dt.timedelta(seconds=t1t0))
-            if shline.startswith("time "):
+            strftime = seconds_strftime(t1t0)
+            if timed:
                 print(f"... {strftime} ...", file=sys.stderr)
 
             if run.returncode:
@@ -1167,25 +1344,23 @@ class GitGopher:
 
 
 #
-# Amp up Import DateTime as DT
+# Amp up Import Time
 #
 
 
-def dt_timedelta_strftime(td: dt.timedelta, depth: int = 2, str_zero: str = "0s") -> str:
+def seconds_strftime(seconds: float, depth: int = 2, str_zero: str = "0s") -> str:
     """Give 'w d h m s ms us ms' to mean 'weeks=', 'days=', etc"""
 
-    # Pick Weeks out of Days, Minutes out of Seconds, and Millis out of Micros
+    # Pick Weeks out of Micros, Days out of Weeks, Hours out of Days, etc
 
-    w = td.days // 7
-    d = td.days % 7
+    us_total = round(seconds * 1_000_000)  # rounds like DT TimeDelta, but builds no TimeDelta
 
-    h = td.seconds // 3600
-    h_s = td.seconds % 3600
-    m = h_s // 60
-    s = h_s % 60
-
-    ms = td.microseconds // 1000
-    us = td.microseconds % 1000
+    w, d_us = divmod(us_total, 7 * 86400 * 1_000_000)
+    d, h_us = divmod(d_us, 86400 * 1_000_000)
+    h, m_us = divmod(h_us, 3600 * 1_000_000)
+    m, s_us = divmod(m_us, 60 * 1_000_000)
+    s, ms_us = divmod(s_us, 1_000_000)
+    ms, us = divmod(ms_us, 1000)
 
     # Catenate Value-Key Pairs in order, but strip leading and trailing Zeroes,
     # and choose one unit arbitrarily when speaking of any zeroed TimeDelta
@@ -1221,25 +1396,43 @@ def dt_timedelta_strftime(td: dt.timedelta, depth: int = 2, str_zero: str = "0s"
 
 assert shlex.quote("HEAD~1") == "'HEAD~1'", (shlex.quote("HEAD~1"),)
 
+ShlexCalmlyUnsafeSearch = re.compile(r"[^\w@%+=:,./~-]", flags=re.ASCII).search  # ShLex, plus ~
+
 
 def shlex_quote_calmly(arg: str) -> str:
     """Quote like ShLex Quote, but not more carefully at ~ than at @, except for starts with ~"""
 
-    quote = shlex.quote(arg)
-
-    at_quotable = arg.replace("~", "@")
-    at_quote = shlex.quote(at_quotable)
-
-    if at_quote == at_quotable:
+    if arg and not ShlexCalmlyUnsafeSearch(arg):
         if not arg.startswith("~"):
-            return arg
+            return arg  # skips ShLex Quote, when no Char needs quoting
 
+    quote = shlex.quote(arg)
     return quote
 
 
 assert shlex_quote_calmly("HEAD~1") == "HEAD~1", (shlex_quote_calmly("HEAD~1"),)
 
 
+def shlex_join_calmly(argv: typing.Iterable[str]) -> str:
+    """Join like ShLex Join, but quote calmly, and check all the Args at once for no quoting"""
+
+    args = list(argv)
+
+    if all(args) and not ShlexCalmlyUnsafeSearch("@".join(args)):  # keeps ' ' inside Args unsafe
+        if not any(_.startswith("~") for _ in args):
+            return " ".join(args)
+
+    unsafe = ShlexCalmlyUnsafeSearch
+    quotes = list(
+        (_ if (_ and not unsafe(_) and not _.startswith("~")) else shlex.quote(_)) for _ in args
+    )  # inlines .shlex_quote_calmly, to skip a Function Call per Arg
+
+    return " ".join(quotes)
+
+
+assert shlex_join_calmly(["HEAD~1", "a b", ""]) == "HEAD~1 'a b' ''", (shlex_join_calmly([]),)
+
+
 #
 # Run from the Shell Command Line, if not imported
 #
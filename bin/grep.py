@@ -24,7 +24,6 @@ examples:
 # code reviewed by people and by Black, Flake8, Mypy-Strict, & Pylance-Standard
 
 
-import os
 import shlex
 import signal
 import subprocess
@@ -58,39 +57,42 @@ class GrepGopher:
 
         self.exit_if_dash_dash_help()
 
-        shfile_shargv = shfile_shargv = sys.argv[1:]
+        shfile_shargv = sys.argv[1:]
 
-        shverb = os.path.basename(shfile_shargv[0])
+        shverb = shfile_shargv[0].rpartition("/")[-1]  # same as Posix basename, in C
         assert shverb, (shfile_shargv, shverb)
-        shverb_shargv = (shverb, *shfile_shargv[1:])
+        shargs = tuple(shfile_shargv[1:])  # the Shell Args after the Shell Verb, copied once
 
-        alt_shverb = shverb_shargv[0]
-        if alt_shverb != "g":
-            _ = NotImplementedError(alt_shverb)
+        if shverb != "g":
+            _ = NotImplementedError(shverb)
             print(
-                f"grep.py: NotImplementedError: |{alt_shverb} in a pipe, not from </dev/tty",
+                f"grep.py: NotImplementedError: |{shverb} in a pipe, not from </dev/tty",
                 file=sys.stderr,
             )
             sys.exit(2)  # exits 2 for bad args
 
-        if not shverb_shargv[1:]:
+        if not shargs:
             print("usage: |grep.py SHWORD [SHWORD ...]", file=sys.stderr)
             sys.exit(2)  # exits 2 for bad args
 
         argv = list()
         argv.append("grep")
-        argv.extend(self._shargs_grep_expand_ai_e_(shverb_shargv[1:]))
+        argv.extend(self._shargs_grep_expand_ai_e_(shargs))
 
         join = shlex.join(argv)
         print("|" + join, file=sys.stderr)
 
         assert int(signal.SIGPIPE) == 13, (signal.SIGPIPE,)  # +13, not -13
+        assert int(signal.SIGINT) == 2, (signal.SIGINT,)  # +2, not -2
 
-        pass_fds = tuple(int(_) for _ in os.listdir("/dev/fd"))
-        run = subprocess.run(argv, pass_fds=pass_fds)
+        signal.signal(signal.SIGINT, lambda signum, frame: None)  # leaves ⌃C to the Child
+
+        run = subprocess.run(argv, close_fds=False)  # passes down each Fd we were given
         if run.returncode:
             if run.returncode == -13:
                 pass
+            elif run.returncode == -2:
+                sys.exit(130)  # 0x80 + signal.SIGINT, same as the Shell
             else:
                 print("+ exit", run.returncode, file=sys.stderr)
 
@@ -99,7 +101,7 @@ class GrepGopher:
         # todo: do we ever call Grep so that it needs its Stdin & Stdin Fd cut off ?
 
         #
-        # Passing down the 'pass_fds=' ducks out of this kind of failure
+        # Passing down 'close_fds=False' ducks out of this kind of failure
         #
         #   % echo |bin/grep.py alf brav -- <(echo alfa bravo)
         #   |grep -ai -e alf -e brav -- /dev/fd/12
@@ -122,15 +124,16 @@ class GrepGopher:
 
         strs = list()
         strs.append("-ai")  # -a = --text  # -i = --ignore-case
-        for i, arg in enumerate(shargs):
-            if arg == "--":
-                strs.extend(shargs[i:])
-                break
-            elif arg.startswith("-"):
-                strs.append(arg)
-            else:
-                strs.append("-e")
-                strs.append(arg)
+
+        head: tuple[str, ...] = shargs
+        tail: tuple[str, ...] = ()  # copies no Slices, when no '--'
+        if "--" in shargs:
+            cut = shargs.index("--")
+            head = shargs[:cut]
+            tail = shargs[cut:]
+
+        strs.extend(x for a in head for x in ((a,) if a.startswith("-") else ("-e", a)))
+        strs.extend(tail)
 
         argv = tuple(strs)
         return argv
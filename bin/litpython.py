@@ -28,20 +28,15 @@ from __future__ import annotations  # backports new Datatype Syntaxes into old P
 
 import __main__
 import argparse
-import bdb
 import collections.abc  # .collections.abc is not .abc import collections.abc collections.abc.Callable is not typing.Callable
-import dataclasses
 import datetime as dt
-import difflib
 import importlib
 import logging
 import os
-import pdb
 import signal
 import subprocess
 import sys
 import textwrap
-import traceback
 import types
 import urllib  # eager 'import urllib', at first without our lazy 'import urllib.parse'
 import zoneinfo
@@ -97,7 +92,7 @@ def try_main() -> None:
 
     pylines = ns.pylines
     pyjoin = "\n".join(pylines)
-    pytext = textwrap.dedent(pyjoin).strip()
+    pytext = textwrap.dedent(pyjoin).strip() if ("\n" in pyjoin) else pyjoin.strip()
 
     _globals_add_lazy_imports_()
     _globals_add_eager_objects_()
@@ -139,20 +134,16 @@ def _globals_add_eager_objects_() -> None:
 
     g = globals()
 
-    if "logger" not in g.keys():
-        logger = logging.getLogger(__name__)
-        g["logger"] = logger
+    g.setdefault("p", print)
+    g.setdefault("t", PacificLaunch)
 
-    if "p" not in g.keys():
-        p = print
-        g["p"] = p
+    if "logger" not in g:
+        g["logger"] = logging.getLogger(__name__)
 
-    if "parser" not in g.keys():
-        parser = argparse.ArgumentParser()
-        g["parser"] = parser
+    if "parser" not in g:
+        g["parser"] = argparse.ArgumentParser()
 
-    if "t" not in g.keys():
-        g["t"] = PacificLaunch
+    # calls .setdefault only for Objects already made, never for Objects to be constructed
 
 
 #
@@ -166,32 +157,26 @@ def _globals_add_lazy_imports_() -> None:
     g = globals()
 
     for name in PYTHON_IMPORTS:
-        if name not in g.keys():
-            g[name] = LazyImport(name)
+        if name not in g:
+            g[sys.intern(name)] = LazyImport(name)  # interns, as Compile does for Code Names
 
-    if "D" not in g.keys():
-        D = LazyImport(_import_="decimal", _as_="D", _what_="Decimal")
-        g["D"] = D
+    if "D" not in g:
+        g["D"] = LazyImport(_import_="decimal", _as_="D", _what_="Decimal")
 
-    if "dt" not in g.keys():
-        dt = LazyImport(_import_="datetime", _as_="dt")
-        g["dt"] = dt
+    if "dt" not in g:
+        g["dt"] = LazyImport(_import_="datetime", _as_="dt")
 
-    if "et" not in g.keys():
-        et = LazyImport(_import_="xml.etree.ElementTree", _as_="et")
-        g["et"] = et
+    if "et" not in g:
+        g["et"] = LazyImport(_import_="xml.etree.ElementTree", _as_="et")
 
-    if "np" not in g.keys():
-        np = LazyImport(_import_="numpy", _as_="np")
-        g["np"] = np
+    if "np" not in g:
+        g["np"] = LazyImport(_import_="numpy", _as_="np")
 
-    if "pd" not in g.keys():
-        pd = LazyImport(_import_="pandas", _as_="pd")
-        g["pd"] = pd
+    if "pd" not in g:
+        g["pd"] = LazyImport(_import_="pandas", _as_="pd")
 
-    if "plt" not in g.keys():
-        plt = LazyImport(_import_="matplotlib.pyplot", _as_="plt")
-        g["plt"] = plt
+    if "plt" not in g:
+        g["plt"] = LazyImport(_import_="matplotlib.pyplot", _as_="plt")
 
     setattr(urllib, "parse", LazyImport(_import_="urllib.parse"))
 
@@ -208,55 +193,73 @@ class LazyImport:
         self._import_ = _import_
         self._as_ = _import_ if (_as_ is None) else _as_
         self._what_ = _what_
+        self._value_: object = self  # stands in for itself, till fetched
 
     def _fetch_(self) -> object:
-        module = importlib.import_module(self._import_)
+        value = self._value_
+        if value is not self:
+            return value  # imports once per LazyImport, not once per Y.Q
+
+        module = sys.modules.get(self._import_)  # peeks, like Django 'cached_import'
+        if module is None:
+            module = importlib.import_module(self._import_)
+
         value = module if (self._what_ is None) else getattr(module, self._what_)
+        self._value_ = value
         globals()[self._as_] = value
+
         return value
 
     def __getattribute__(self, name: str) -> object:
-        if name in "_import_ _as_ _what_ _fetch_".split():
+        if name in LazyImportAttrs:
             return super().__getattribute__(name)
-        value = self._fetch_()
+        value = super().__getattribute__("_value_")
+        if value is self:
+            value = self._fetch_()
         return getattr(value, name)
 
     def __repr__(self) -> str:
-        value = self._fetch_()
+        value = super().__getattribute__("_value_")
+        if value is self:
+            value = self._fetch_()
         return repr(value)
 
+    # a Module '__getattr__' can't stand in here, because Exec & the Py Repl look up bare Names
+    # in Globals() without ever calling it, so Y.Q for 'print(repr(globals()))' needs a Y in place
+
 
-_PYTHON_IMPORTS_TEXT_ = """
+LazyImportAttrs = frozenset("_import_ _as_ _what_ _value_ _fetch_".split())
 
+
+PYTHON_IMPORTS = tuple(  # splits one Str, concatenated at Compile Time, not at each Launch
     # the most eager Imports
     #
     #   import sys
     #   items = list(sys.modules.items())
     #   sorted(_[0] for _  in items if not _[0].startswith("_") and not hasattr(_[-1], "__file__"))
     #
-
+    """
     __main__
 
     atexit builtins errno itertools marshal posix pwd sys time
-
-
+    """
     # the ".so" Shared Object Libraries of
     #
     #   cd $(python3 -c 'import os, readline; print(os.path.dirname(readline.__file__))')
     #   ls *.so |grep -v ^_
     #
     # minus obscure:  xxlimited_35 xxlimited xxsubtype
-
+    #
+    """
     array  binascii  cmath  fcntl  grp
     math mmap  readline resource  select syslog  termios  unicodedata  zlib
-
-
+    """
     # the Py Files of
     #
     #   cd $(python3 -c 'import abc, os; print(os.path.dirname(abc.__file__))')
     #   ls *.py |grep -v ^_ |cut -d. -f1 |cut -d/ -f1 |LC_ALL=C sort
     #
-
+    """
     abc annotationlib antigravity argparse ast  base64 bdb bisect bz2
     cProfile calendar cmd code codecs codeop colorsys
         compileall configparser contextlib contextvars copy copyreg csv
@@ -276,30 +279,25 @@ _PYTHON_IMPORTS_TEXT_ = """
     tabnanny tarfile tempfile textwrap this threading timeit token tokenize
         trace traceback tracemalloc tty turtle types typing
     uuid  warnings wave weakref webbrowser  zipapp zipimport
-
+    """
     # the Py Folders of
     #
     #   cd $(python3 -c 'import abc, os; print(os.path.dirname(abc.__file__))')
     #   ls */__init__.py |grep -v ^_ |cut -d. -f1 |cut -d/ -f1 |LC_ALL=C sort
-
+    #
+    """
     asyncio  collections compression concurrent ctypes curses  dbm
     email encodings ensurepip  html http  idlelib importlib  json  logging
 
     multiprocessing  pathlib pydoc_data  re  sqlite3 string sysconfig
     test tkinter tomllib turtledemo  unittest urllib  venv  wsgiref  xml xmlrpc  zipfile zoneinfo
-
-
+    """
     # from VEnv Pip Install
-
+    #
+    """
     jira matplotlib mysql numpy pandas psutil psycopg2 redis requests
-
-"""
-
-
-PYTHON_IMPORTS = _PYTHON_IMPORTS_TEXT_.splitlines()
-PYTHON_IMPORTS = list(_.partition("#")[0] for _ in PYTHON_IMPORTS)
-PYTHON_IMPORTS = list(_.strip() for _ in PYTHON_IMPORTS)
-PYTHON_IMPORTS = " ".join(PYTHON_IMPORTS).split()
+    """.split()
+)
 
 assert len(PYTHON_IMPORTS) == 199, (len(PYTHON_IMPORTS), 199)  # Feb/2026 Python 3.14.3
 
@@ -312,7 +310,6 @@ assert len(PYTHON_IMPORTS) == 199, (len(PYTHON_IMPORTS), 199)  # Feb/2026 Python
 _ARGPARSE_3_10_ = (3, 10)  # Oct/2021 Python 3.10, like from Ubuntu 2022
 
 
-@dataclasses.dataclass(order=True)  # , frozen=True)
 class ArgDocParser:
     """Scrape Prog & Description & Epilog from Doc to form an ArgParse Argument Parser"""
 
@@ -331,11 +328,13 @@ class ArgDocParser:
         self.add_help = add_help
 
         text = textwrap.dedent(doc).strip()
+        lines = text.splitlines()  # splits once, for every Scrape
 
-        prog = self._scrape_prog_(text)
-        description = self._scrape_description_(text)
-        epilog = self._scrape_epilog_(text, description=description)
-        closing = self._scrape_closing_(epilog)
+        prog = self._scrape_prog_(lines)
+        description = self._scrape_description_(lines)
+        epilog_lines = self._scrape_epilog_lines_(lines, description=description)
+        epilog = "\n".join(epilog_lines)
+        closing = self._scrape_closing_(epilog_lines)
 
         parser = argparse.ArgumentParser(  # doesn't distinguish Closing from Epilog
             prog=prog,
@@ -365,9 +364,11 @@ class ArgDocParser:
         parser = self.parser
         closing = self.closing
 
-        # Print Diffs & exit nonzero, when Arg Doc wrong
+        # Print Diffs & exit nonzero, when Arg Doc wrong,
+        # but check only while printing Closing or Help or Usage, not while running Code
 
-        diffs = self._diff_doc_vs_format_help_()
+        helpish = (not args) or any((_.startswith("-") and _ != "--") for _ in args)
+        diffs = self._diff_doc_vs_format_help_() if helpish else list()
         if diffs:
             if sys.version_info >= _ARGPARSE_3_10_:
                 print("\n".join(diffs))
@@ -407,20 +408,17 @@ class ArgDocParser:
     # Scrape out Parser, Prog, Description, Epilog, & Closing from Doc Text
     #
 
-    def _scrape_prog_(self, text: str) -> str:
+    def _scrape_prog_(self, lines: list[str]) -> str:
         """Pick the Prog out of the Usage Graf that starts the Doc"""
 
-        lines = text.splitlines()
         prog = lines[0].split()[1]  # second Word of first Line  # 'prog' from 'usage: prog'
 
         return prog
 
-    def _scrape_description_(self, text: str) -> str:
+    def _scrape_description_(self, lines: list[str]) -> str:
         """Take the first Line of the Graf after the Usage Graf as the Description"""
 
-        lines = text.splitlines()
-
-        firstlines = list(_ for _ in lines if _ and (_ == _.lstrip()))
+        firstlines = [_ for _ in lines if _ and (_ == _.lstrip())]
         docline = firstlines[1]  # first Line of second Graf
 
         description = docline
@@ -429,41 +427,36 @@ class ArgDocParser:
 
         return description
 
-    def _scrape_epilog_(self, text: str, description: str) -> str:
+    def _scrape_epilog_lines_(self, lines: list[str], description: str) -> list[str]:
         """Take up the Lines past Usage, Positional Arguments, & Options, as the Epilog"""
 
-        lines = text.splitlines()
-
-        epilog = ""
+        epilog_lines: list[str] = list()
         for index, line in enumerate(lines):
             if self._docline_is_skippable_(line) or (line == description):
                 continue
 
-            epilog = "\n".join(lines[index:])
+            epilog_lines = lines[index:]
             break
 
-        return epilog  # maybe empty
+        return epilog_lines  # maybe empty
 
     def _docline_is_skippable_(self, docline: str) -> bool:
         """Guess when a Doc Line can't be the first Line of the Epilog"""
 
         strip = docline.rstrip()
+        prefixes = (" ", "usage", "positional arguments", "options")  # a Constant Tuple
 
-        skippable = not strip
-        skippable = skippable or strip.startswith(" ")  # includes .startswith("  ")
-        skippable = skippable or strip.startswith("usage")
-        skippable = skippable or strip.startswith("positional arguments")
-        skippable = skippable or strip.startswith("options")  # ignores "optional arguments"
+        skippable = (not strip) or strip.startswith(prefixes)  # scans all Prefixes in one Call
 
         return skippable
 
-    def _scrape_closing_(self, epilog: str) -> str:
-        """Pick out the last Graf of the Epilog, minus its Top Line"""
+        # " " includes "  ", and "options" ignores "optional arguments"
 
-        lines = epilog.splitlines()
+    def _scrape_closing_(self, lines: list[str]) -> str:
+        """Pick out the last Graf of the Epilog, minus its Top Line"""
 
-        indices = list(_ for _ in range(len(lines)) if lines[_])  # drops empty Lines
-        indices = list(_ for _ in indices if not lines[_].startswith(" "))  # finds top Lines
+        indices = [_ for _ in range(len(lines)) if lines[_] and not lines[_].startswith(" ")]
+        # drops empty Lines and finds top Lines, in one pass
 
         closing = ""
         if indices:
@@ -492,16 +485,16 @@ class ArgDocParser:
         basename = os.path.split(__file__)[-1]
         fromfile = "{} --help".format(basename)
 
-        # Fetch the Parser Doc from a fitting virtual Terminal
+        # Fetch the Parser Doc from a fitting virtual Terminal, but leave Os Environ untouched
         # Fetch from a Black Terminal of 89 columns, not from the current Terminal Width
         # Fetch from later Python of "options:", not earlier Python of "optional arguments:"
 
-        default_eq_none = None
-        with_columns_else = os.environ.get("COLUMNS", default_eq_none)  # checkpoints
-        with_no_color_else = os.environ.get("NO_COLOR", default_eq_none)  # checkpoints
+        with_formatter_class = parser.formatter_class  # checkpoints
+        with_color_else = getattr(parser, "color", None)  # checkpoints  # None till Python 3.14
 
-        os.environ["COLUMNS"] = str(89)  # adds or replaces
-        os.environ["NO_COLOR"] = "True"  # adds or replaces
+        parser.formatter_class = lambda prog: argparse.RawTextHelpFormatter(prog, width=89 - 2)
+        if with_color_else is not None:
+            setattr(parser, "color", False)  # same as NO_COLOR
 
         try:
 
@@ -509,23 +502,23 @@ class ArgDocParser:
 
         finally:
 
-            if with_no_color_else is None:
-                del os.environ["NO_COLOR"]  # removes
-            else:
-                os.environ["NO_COLOR"] = with_no_color_else  # reverts
+            parser.formatter_class = with_formatter_class  # reverts
+            if with_color_else is not None:
+                setattr(parser, "color", with_color_else)  # reverts
 
-            if with_columns_else is None:
-                del os.environ["COLUMNS"]  # removes
-            else:
-                os.environ["COLUMNS"] = with_columns_else  # reverts
+            # 89 - 2, because ArgParse takes 2 Columns off of COLUMNS
 
         b = b_text.splitlines()
+        if a == b:
+            return list()  # skips Difflib, when no Diffs
 
         tofile = "ArgumentParser(...)"
 
         # Form >= 0 Diffs from Help Doc to Parser Format_Help,
         # but ask for lineterm="", for else the '---' '+++' '@@' Diff Control Lines end with '\n'
 
+        import difflib  # imported late, because rarely called for
+
         diffs = list(difflib.unified_diff(a=a, b=b, fromfile=fromfile, tofile=tofile, lineterm=""))
 
         # Succeed
@@ -605,12 +598,16 @@ def sys_excepthook_pdb_pm(
 
     # Quit quietly, early now, if BdbQuit
 
-    if exc_type is bdb.BdbQuit:
+    bdb = sys.modules.get("bdb")  # can't have raised BdbQuit, if not yet imported
+    if (bdb is not None) and (exc_type is bdb.BdbQuit):
         with_stderr.write("BdbQuit\n")
         sys.exit(130)  # 0x80 + signal.SIGINT  # same as for KeyboardInterrupt
 
     # Print the usual 'Traceback (most recent call last):', & Traceback, & Assert
 
+    import pdb  # imported late, because rarely called for
+    import traceback  # imported late, because rarely called for
+
     print(file=with_stderr)
     print(file=with_stderr)  # twice
 
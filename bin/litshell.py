@@ -183,6 +183,9 @@ class ShellGopher:
     data: bytes | None  # 1 Sponge of 1 File of Bytes
     bricks: list[ShellBrick]  # Code that works over the Sponge
 
+    hashing_name: str | None  # 'md5' or 'sha256' to hash the Bytes as they arrive, not buffered
+    hashed: tuple[str, int] | None  # the Hex Digest & Length of the Bytes hashed as they arrived
+
     #
 
     def __init__(self) -> None:
@@ -220,6 +223,9 @@ class ShellGopher:
         self.data = None
         self.bricks = list()
 
+        self.hashing_name = None
+        self.hashed = None
+
     def run_main_argv_minus(self, argv_minus: list[str]) -> None:  # noqa C901 too complex  # todo2:
         """Compile & run each Option or Positional Argument"""
 
@@ -467,6 +473,11 @@ class ShellGopher:
             # todo8: accept 'None' as a Pos Arg of a Shell Brick ?
             # todo8: declare which Bricks take which Args, compile-time reject TypeError
 
+        # Choose to hash the Bytes as they arrive, or not
+
+        assert self.hashing_name is None, (self.hashing_name,)
+        self.hashing_name = self._compile_hashing_name_()
+
     def parse_text_else(self, text: str, verbs: list[str]) -> str | None:
         """Evaluate a Str Literal, else return None"""
 
@@ -538,6 +549,31 @@ class ShellGopher:
 
         return writing_stdout
 
+    def _compile_hashing_name_(self) -> str | None:
+        """Choose to hash the Bytes as they arrive, when only hashing them, else not"""
+
+        bricks = self.bricks
+        writing_pbcopy = self.writing_pbcopy
+        writing_file = self.writing_file
+
+        if writing_pbcopy or writing_file:
+            return None  # because copying out the Input Bytes needs all of them at once
+
+        if len(bricks) != 3:
+            return None
+        if (bricks[0].verb, bricks[-1].verb) != ("__enter__", "__exit__"):
+            return None
+
+        brick = bricks[1]
+        if brick.func == brick.from_bytes_md5:
+            return "md5"
+        if brick.func == brick.from_bytes_sha256:
+            return "sha256"
+
+        return None
+
+        # 'pb md5', 'pb .sha256', '|pb md5sum |', etc
+
     def _compile_brick_if_(self, verb: str) -> ShellBrick:
         """Compile one Brick"""
 
@@ -832,6 +868,9 @@ class ShellGopher:
         return t
 
 
+PbPasteArgv = ("pbpaste",)  # pulls Bytes from the Os Copy/Paste Clipboard Buffer
+
+
 class ShellBrick:
     """Run well as 1 Shell Pipe Filter Brick"""
 
@@ -1092,6 +1131,11 @@ class ShellBrick:
         assert sg.data is None, (len(sg.data),)
         assert not sg.writing_file, (sg.writing_file,)
 
+        if sg.hashing_name:  # pb md5, |pb sha256, etc
+            assert not writing_pbcopy, (writing_pbcopy,)
+            sg.hashed = self.read_hashed(sg.hashing_name)
+            return
+
         if sys_stdin_isatty:  # pb, pb |, pb -
             data = self.pbpaste()  # yep
             sg.data = data
@@ -1103,6 +1147,44 @@ class ShellBrick:
             if writing_pbcopy:
                 self.pbcopy(data)
 
+    def read_hashed(self, name: str) -> tuple[str, int]:
+        """Hash the Bytes of PbPaste or Stdin as they arrive, without buffering all of them"""
+
+        sg = self.shell_gopher
+        sys_stdin_isatty = sg.sys_stdin_isatty
+
+        hasher = hashlib.new(name, usedforsecurity=False)
+        length = 0
+
+        chunk_size = 1 << 20  # 1 MiB, because small Chunks cost more Calls & Syscalls
+
+        proc = None
+        read = sys.stdin.buffer.read  # |pb md5, |pb sha256, etc
+        if sys_stdin_isatty:  # pb md5, pb sha256, etc
+            proc = subprocess.Popen(PbPasteArgv, stdin=subprocess.DEVNULL, stdout=subprocess.PIPE)
+            assert proc.stdout is not None
+            read = proc.stdout.read
+
+        try:
+            while True:
+                chunk = read(chunk_size)
+                if not chunk:
+                    break
+                hasher.update(chunk)
+                length += len(chunk)
+        finally:
+            if proc is not None:
+                with proc:  # closes the Pipe & waits for the Exit
+                    pass
+
+        if proc is not None:
+            if proc.returncode:  # same as 'subprocess.run(check=True)' at .pbpaste
+                raise subprocess.CalledProcessError(proc.returncode, cmd=PbPasteArgv)
+
+        hexdigest = hasher.hexdigest()
+
+        return (hexdigest, length)
+
     def run_pipe_exit(self) -> None:
         """Implicitly exit the Shell Pipe"""
 
@@ -1235,7 +1317,7 @@ class ShellBrick:
         """Pull Bytes from the Os Copy/Paste Clipboard Buffer"""
 
         run = subprocess.run(
-            ["pbpaste"], stdin=subprocess.DEVNULL, check=True, stdout=subprocess.PIPE
+            PbPasteArgv, stdin=subprocess.DEVNULL, check=True, stdout=subprocess.PIPE
         )
 
         assert not run.returncode  # because .check=True
@@ -1306,17 +1388,19 @@ class ShellBrick:
     def from_bytes_md5(self) -> None:
         """hashlib.md5(bytes(sys.i)).hexdigest()"""
 
+        sg = self.shell_gopher
         verb = self.verb
 
-        idata = self.fetch_idata()
-
-        h = hashlib.md5()
-        h.update(idata)
-        lower_nybbles = h.hexdigest()
+        if sg.hashed is not None:
+            lower_nybbles, length = sg.hashed  # hashed as the Bytes arrived
+        else:
+            idata = self.fetch_idata()
+            lower_nybbles = hashlib.md5(idata, usedforsecurity=False).hexdigest()  # in one C Call
+            length = len(idata)
 
         oline = lower_nybbles
         if verb.startswith("."):  # .md5
-            oline += f"  {len(idata)}"
+            oline += f"  {length}"
         oline += "  -"
 
         olines = [oline]
@@ -1356,17 +1440,19 @@ class ShellBrick:
     def from_bytes_sha256(self) -> None:
         """hashlib.sha256(bytes(sys.i)).hexdigest()"""
 
+        sg = self.shell_gopher
         verb = self.verb
 
-        idata = self.fetch_idata()
-
-        h = hashlib.sha256()
-        h.update(idata)
-        lower_nybbles = h.hexdigest()
+        if sg.hashed is not None:
+            lower_nybbles, length = sg.hashed  # hashed as the Bytes arrived
+        else:
+            idata = self.fetch_idata()
+            lower_nybbles = hashlib.sha256(idata, usedforsecurity=False).hexdigest()
+            length = len(idata)
 
         oline = lower_nybbles
         if verb.startswith("."):  # .sha256
-            oline += f" {len(idata)}"
+            oline += f" {length}"
         oline += "  -"
 
         olines = [oline]
@@ -3080,9 +3166,7 @@ def pathlib_path_read_version(pathname: str) -> str:
     path = pathlib.Path(pathname)
     path_bytes = path.read_bytes()
 
-    hasher = hashlib.md5()
-    hasher.update(path_bytes)
-    hash_bytes = hasher.digest()
+    hash_bytes = hashlib.md5(path_bytes, usedforsecurity=False).digest()
 
     str_hash = hash_bytes.hex()
     str_hash = str_hash.upper()  # such as 32 nybbles 'C24931F77721476EF76D85F3451118DB'